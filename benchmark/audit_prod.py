@@ -8,22 +8,52 @@ Checks:
   3. eprintln! / dbg! left in production paths
   4. Files missing module-level doc comments
   5. Public functions missing doc comments
+
+Per-file results are cached in .reaper-audit-cache.pkl at the repo root and
+reused while a file's contents are unchanged; pass --no-cache to bypass it.
 """
 
+import argparse
+import bisect
+import hashlib
+import itertools
+import operator
+import os
+import pickle
 import re
 import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Iterator, Optional
 
 # ---------------------------------------------------------------------------
 # Config
 # ---------------------------------------------------------------------------
 
 REPO_ROOT = Path(__file__).parent.parent
-SRC_FILES = sorted(
-    list((REPO_ROOT / "src").rglob("*.rs"))
-)
+SRC_DIR = REPO_ROOT / "src"
+
+
+def discover_sources(root: Path) -> list[tuple[Path, os.stat_result]]:
+    """Walk *root* with os.scandir, returning every .rs file with its stat.
+
+    The stat comes from the directory walk itself, so cache hits in main()
+    need no further syscalls.
+    """
+    found: list[tuple[Path, os.stat_result]] = []
+    dirs = [root]
+    while dirs:
+        with os.scandir(dirs.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    dirs.append(Path(entry.path))
+                elif entry.name.endswith(".rs") and entry.is_file():
+                    found.append((Path(entry.path), entry.stat()))
+    found.sort(key=lambda item: item[0])
+    return found
+
 
 # Names that are acceptable uses of unwrap/expect in production
 # (e.g. infallible operations we've verified manually)
@@ -33,11 +63,43 @@ ACCEPTABLE_UNWRAP_PATTERNS = [
     r"serde_json::to_string_pretty\(&output\)\.unwrap\(\)",
 ]
 
+# Compiled once at import — the checkers below run these on every line.
+ACCEPTABLE_UNWRAP_RE = (
+    re.compile("|".join(f"(?:{p})" for p in ACCEPTABLE_UNWRAP_PATTERNS))
+    if ACCEPTABLE_UNWRAP_PATTERNS else None
+)
+FN_RE = re.compile(r"^\s*(pub\s+)?(fn\s+\w+)")
+# Literal text of each production-only token. Each gets its own C-level
+# literal search over the whole file — far faster than one regex alternation.
+TOKEN_LITERALS = {
+    "UNWRAP": ".unwrap()",
+    "EXPECT": ".expect(",
+    "PANIC": "panic!",
+    "DBG": "dbg!",
+    "EPRINTLN": "eprintln!",
+}
+NOTE_RE = re.compile(r"\b(TODO|FIXME|HACK|XXX)\b", re.IGNORECASE)
+NOTE_WORDS = ("todo", "fixme", "hack", "xxx")
+# Characters NOTE_RE matches case-insensitively as an ASCII note letter but
+# which do not lower-case to it (or change length when lower-cased).
+NOTE_CASE_TRAPS = ("\u0130", "\u0131")
+MAGIC_RE = re.compile(r"\b(\d{2,})\b")
+# Every boundary str.splitlines() splits on, so offsets map to the same lines.
+LINEBREAK_RE = re.compile(r"\r\n|[\n\r\v\f\x1c\x1d\x1e\x85\u2028\u2029]")
+# Those boundaries other than a lone "\n".
+ODD_LINEBREAKS = "\r\v\f\x1c\x1d\x1e\x85\u2028\u2029"
+
+# Below this many files the process-pool start-up cost outweighs the scan
+# itself, so the audit runs serially.
+PARALLEL_MIN_FILES = 8
+
+CACHE_PATH = REPO_ROOT / ".reaper-audit-cache.pkl"
+
 # ---------------------------------------------------------------------------
 # Data types
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Issue:
     file: str
     line: int
@@ -49,7 +111,7 @@ class Issue:
         return f"{self.file}:{self.line}: [{self.code}] {self.message}"
 
 
-@dataclass
+@dataclass(slots=True)
 class AuditResult:
     issues: list[Issue] = field(default_factory=list)
 
@@ -63,6 +125,57 @@ class AuditResult:
         return counts
 
 
+@dataclass
+class CacheEntry:
+    key: tuple[int, int]  # (st_mtime_ns, st_size) — cheap staleness check
+    digest: str           # blake2b of the file bytes — authoritative check
+    issues: list[Issue]
+
+
+# ---------------------------------------------------------------------------
+# Cache
+# ---------------------------------------------------------------------------
+
+def audit_version() -> str:
+    """Fingerprint of this script, so any checker change invalidates the cache."""
+    return hashlib.blake2b(Path(__file__).read_bytes(), digest_size=16).hexdigest()
+
+
+def stat_key(st: os.stat_result) -> tuple[int, int]:
+    return (st.st_mtime_ns, st.st_size)
+
+
+def load_cache() -> dict[str, CacheEntry]:
+    # The cache is only an optimisation: whatever a missing, stale or
+    # corrupt file raises while unpickling, start from an empty cache.
+    try:
+        with CACHE_PATH.open("rb") as f:
+            version, entries = pickle.load(f)
+    except Exception:
+        return {}
+    return entries if version == audit_version() else {}
+
+
+def save_cache(entries: dict[str, CacheEntry]) -> None:
+    # Write a temp file beside the cache and rename it into place, so an
+    # interrupted or concurrent run never leaves a torn cache behind.
+    tmp: Optional[str] = None
+    try:
+        fd, tmp = tempfile.mkstemp(
+            prefix=CACHE_PATH.name + ".", suffix=".tmp", dir=CACHE_PATH.parent
+        )
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump((audit_version(), entries), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, CACHE_PATH)
+    except OSError as e:
+        print(f"  WARN could not write {CACHE_PATH.name}: {e}", file=sys.stderr)
+        if tmp is not None:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+
+
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
@@ -76,50 +189,152 @@ def is_test_line(line_stripped: str) -> bool:
     )
 
 
-def parse_blocks(source: str) -> list[tuple[int, int, bool]]:
+def brace_deltas(lines: list[str]) -> list[int]:
+    """Net brace change (opens minus closes) for each line."""
+    # Most lines have no braces at all; a membership test stops at the
+    # first hit, so only lines that contain one pay for the two full counts.
+    return [
+        raw.count("{") - raw.count("}") if "{" in raw or "}" in raw else 0
+        for raw in lines
+    ]
+
+
+def parse_blocks(
+    stripped_lines: list[str], deltas: list[int]
+) -> tuple[list[tuple[int, int, bool]], list[tuple[int, int, str]]]:
     """
-    Return a list of (start_line, end_line, is_test) spans.
+    Return (spans, fn_spans).
+
+    spans is a list of (start_line, end_line, is_test) block spans.
     is_test=True means the block is inside #[cfg(test)] or mod tests { ... }.
 
+    fn_spans is a list of (fn_line, end_line, signature) for every function
+    body outside test blocks, sorted by fn_line.
+
     This is a simple brace-depth tracker — good enough for well-formatted Rust.
     """
-    lines = source.splitlines()
     spans: list[tuple[int, int, bool]] = []
-
-    # Stack entries: (start_line_1indexed, is_test_block)
-    stack: list[tuple[int, bool]] = []
+    fn_spans: list[tuple[int, int, str]] = []
+
+    # Start line (1-indexed) of each open block; its length is the depth.
+    starts: list[int] = []
+    # Depth of the outermost open test block — everything at or below it
+    # is test code — or None when outside test code.
+    test_depth: Optional[int] = None
+    # (depth, fn_line, signature) for open blocks that are function bodies.
+    open_fns: list[tuple[int, int, str]] = []
     # Whether the NEXT opening brace starts a test block
     pending_test = False
+    # A `fn` line whose body has not been opened yet
+    pending_fn: Optional[tuple[int, str]] = None
 
-    for i, raw in enumerate(lines, 1):
-        stripped = raw.strip()
-
+    for i, (stripped, opens) in enumerate(zip(stripped_lines, deltas), 1):
         # Detect test-block markers
         if "#[cfg(test)]" in stripped or (
             stripped.startswith("mod tests") and "{" not in stripped
         ):
             pending_test = True
 
-        opens = raw.count("{") - raw.count("}")  # net brace change
+        if "fn" in stripped:
+            m = FN_RE.match(stripped)
+            if m:
+                pending_fn = (i, m.group(0))
+
         if opens > 0:
             for _ in range(opens):
-                is_test = pending_test or (
-                    bool(stack) and stack[-1][1]
-                )
-                stack.append((i, is_test))
+                depth = len(starts)
+                if pending_test and test_depth is None:
+                    test_depth = depth
+                if pending_fn is not None:
+                    open_fns.append((depth, *pending_fn))
+                starts.append(i)
                 pending_test = False
+                pending_fn = None
         elif opens < 0:
             for _ in range(-opens):
-                if stack:
-                    start, is_test = stack.pop()
+                if starts:
+                    start = starts.pop()
+                    depth = len(starts)
+                    is_test = test_depth is not None and depth >= test_depth
                     spans.append((start, i, is_test))
+                    if depth == test_depth:
+                        test_depth = None
+                    if open_fns and open_fns[-1][0] == depth:
+                        _, fn_line, signature = open_fns.pop()
+                        if not is_test:
+                            fn_spans.append((fn_line, i, signature))
+
+        # A bodiless declaration (`fn f();` in a trait) must not claim the
+        # next block that opens.
+        if pending_fn is not None and stripped.endswith(";"):
+            pending_fn = None
+        # Nor may a one-liner (`fn f() -> T { T::new() }`) whose braces
+        # open and close on the same line.
+        elif pending_fn is not None and pending_fn[0] == i and "{" in stripped and opens <= 0:
+            pending_fn = None
+
+    fn_spans.sort()
+    return spans, fn_spans
+
+
+def build_test_mask(spans: list[tuple[int, int, bool]], n_lines: int) -> bytearray:
+    """Return a per-line flag array (1-indexed) marking lines inside test blocks."""
+    mask = bytearray(n_lines + 1)
+    for s, e, is_test in spans:
+        if is_test:
+            mask[s:e + 1] = b"\x01" * (e - s + 1)
+    return mask
+
+
+def find_all(text: str, literal: str) -> Iterator[int]:
+    """Yield the offset of every occurrence of *literal* in *text*."""
+    i = text.find(literal)
+    while i != -1:
+        yield i
+        i = text.find(literal, i + 1)
+
+
+def line_starts(source: str, lines: list[str]) -> list[int]:
+    """Offset of the first character of each line, as str.splitlines() splits."""
+    if any(c in source for c in ODD_LINEBREAKS):
+        starts = [0]
+        starts.extend(m.end() for m in LINEBREAK_RE.finditer(source))
+        return starts
+    # Plain "\n" endings: prefix sums of the line lengths, computed in C.
+    return [0, *itertools.accumulate(map(operator.add, map(len, lines), itertools.repeat(1)))]
+
+
+def scan_tokens(source: str, lines: list[str]) -> dict[int, dict[str, str]]:
+    """Locate every line-local token: {line_no: {kind: matched_text}}.
+
+    Each token kind is found by its own literal search over the whole file,
+    so only lines that contain a token ever reach Python-level code. For
+    NOTE the matched text is the first annotation word on the line.
+    """
+    found: list[tuple[int, str, str]] = []  # (offset, kind, text)
+    for kind, literal in TOKEN_LITERALS.items():
+        found.extend((i, kind, literal) for i in find_all(source, literal))
 
-    return spans
-
-
-def in_test_block(line_no: int, spans: list[tuple[int, int, bool]]) -> bool:
-    """Return True if line_no falls inside any test block span."""
-    return any(s <= line_no <= e and is_test for s, e, is_test in spans)
+    if any(trap in source for trap in NOTE_CASE_TRAPS):
+        found.extend((m.start(), "NOTE", m.group(1)) for m in NOTE_RE.finditer(source))
+    else:
+        # Find candidates case-insensitively via the lower-cased text, then
+        # confirm word boundaries against the original.
+        lowered = source.lower()
+        for word in NOTE_WORDS:
+            for i in find_all(lowered, word):
+                m = NOTE_RE.match(source, i)
+                if m:
+                    found.append((i, "NOTE", m.group(1)))
+
+    if not found:
+        return {}
+    found.sort()
+    starts = line_starts(source, lines)
+    hits: dict[int, dict[str, str]] = {}
+    for offset, kind, text in found:
+        hits.setdefault(bisect.bisect_right(starts, offset), {}).setdefault(kind, text)
+    return hits
 
 
 def is_comment(stripped: str) -> bool:
@@ -127,86 +342,71 @@ def is_comment(stripped: str) -> bool:
 
 
 def acceptable_unwrap(line: str) -> bool:
-    for pat in ACCEPTABLE_UNWRAP_PATTERNS:
-        if re.search(pat, line):
-            return True
-    return False
+    return ACCEPTABLE_UNWRAP_RE is not None and ACCEPTABLE_UNWRAP_RE.search(line) is not None
 
 
 # ---------------------------------------------------------------------------
 # Checkers
 # ---------------------------------------------------------------------------
 
-def check_unwrap_expect_panic(
-    source: str, rel_path: str, spans: list[tuple[int, int, bool]], result: AuditResult
+def check_lines(
+    hits: dict[int, dict[str, str]],
+    lines: list[str],
+    stripped_lines: list[str],
+    rel_path: str,
+    test_mask: bytearray,
+    result: AuditResult,
 ) -> None:
-    """Flag .unwrap() and panic! outside test blocks.
-
-    Note: .expect("reason") is the *idiomatic* Rust way to document
-    infallible invariants and is intentionally NOT flagged as blocking.
-    It is reported as an info-level item so reviewers can verify the
-    invariant claim is correct.
+    """Every line-local check, run over the lines scan_tokens() matched.
+
+    - .unwrap() / panic! outside test blocks (blocking).
+    - .expect("reason") outside test blocks. This is the *idiomatic* Rust way
+      to document infallible invariants and is intentionally NOT flagged as
+      blocking; it is reported as info so reviewers can verify the invariant
+      claim is correct.
+    - dbg! / eprintln! outside test blocks.
+    - TODO / FIXME / HACK / XXX anywhere, including comments and tests.
     """
-    for i, raw in enumerate(source.splitlines(), 1):
-        stripped = raw.strip()
-        if is_comment(stripped):
-            continue
-        if in_test_block(i, spans):
-            continue
-        if acceptable_unwrap(raw):
+    main_rs = rel_path.endswith("main.rs")
+    for i, kinds in hits.items():
+        raw = lines[i - 1]
+        stripped = stripped_lines[i - 1]
+
+        # Each kind is reported at most once per line, however often it occurs.
+        if "NOTE" in kinds:
+            # Annotations count everywhere, including comments and tests.
+            word = kinds["NOTE"].upper()
+            result.add(rel_path, i, "Maintenance", f"{word} annotation: {stripped[:80]}", word)
+
+        if is_comment(stripped) or test_mask[i]:
             continue
 
-        if ".unwrap()" in raw:
+        if "UNWRAP" in kinds or "EXPECT" in kinds or "PANIC" in kinds:
+            if acceptable_unwrap(raw):
+                kinds = kinds.keys() - {"UNWRAP", "EXPECT", "PANIC"}
+        if "UNWRAP" in kinds:
             result.add(rel_path, i, "Panics", f".unwrap() in production code: {stripped[:80]}", "UNWRAP")
-        if re.search(r"\.expect\(", raw):
-            # .expect("reason") is idiomatic — report as info, not blocking.
+        if "EXPECT" in kinds:
             result.add(rel_path, i, "Info", f".expect() invariant assertion (verify reason): {stripped[:80]}", "EXPECT_INFO")
-        if "panic!" in raw:
+        if "PANIC" in kinds:
             result.add(rel_path, i, "Panics", f"panic! in production code: {stripped[:80]}", "PANIC")
-
-
-def check_debug_macros(
-    source: str, rel_path: str, spans: list[tuple[int, int, bool]], result: AuditResult
-) -> None:
-    """Flag dbg!, eprintln! outside test blocks."""
-    for i, raw in enumerate(source.splitlines(), 1):
-        stripped = raw.strip()
-        if is_comment(stripped):
-            continue
-        if in_test_block(i, spans):
-            continue
-
-        if "dbg!" in raw:
+        if "DBG" in kinds:
             result.add(rel_path, i, "Debug", f"dbg! left in production code: {stripped[:80]}", "DBG")
         # eprintln! is OK in main.rs error handlers but flag elsewhere
-        if "eprintln!" in raw and not rel_path.endswith("main.rs"):
+        if "EPRINTLN" in kinds and not main_rs:
             result.add(rel_path, i, "Debug", f"eprintln! in non-main production code: {stripped[:80]}", "EPRINTLN")
 
 
-def check_todo_fixme(
-    source: str, rel_path: str, result: AuditResult
-) -> None:
-    """Flag TODO / FIXME / HACK / XXX in any code or comments."""
-    pattern = re.compile(r"\b(TODO|FIXME|HACK|XXX)\b", re.IGNORECASE)
-    for i, raw in enumerate(source.splitlines(), 1):
-        if pattern.search(raw):
-            stripped = raw.strip()
-            word = pattern.search(raw).group(1).upper()
-            result.add(rel_path, i, "Maintenance", f"{word} annotation: {stripped[:80]}", word)
-
-
 def check_missing_file_doc(
-    source: str, rel_path: str, result: AuditResult
+    stripped_lines: list[str], rel_path: str, result: AuditResult
 ) -> None:
     """Flag files that have no //! module-level doc comment."""
     # Ignore lib.rs (it's just re-exports) and mod.rs files
     if rel_path.endswith("lib.rs") or rel_path.endswith("mod.rs"):
         return
 
-    lines = source.splitlines()
     has_doc = False
-    for line in lines[:10]:  # doc comment must be near the top
-        stripped = line.strip()
+    for stripped in stripped_lines[:10]:  # doc comment must be near the top
         if stripped.startswith("//!") or stripped.startswith("///"):
             has_doc = True
             break
@@ -219,56 +419,40 @@ def check_missing_file_doc(
 
 
 def check_large_functions(
-    source: str, rel_path: str, spans: list[tuple[int, int, bool]], result: AuditResult
+    fn_spans: list[tuple[int, int, str]], rel_path: str, result: AuditResult
 ) -> None:
     """Flag functions longer than 120 lines (excluding test blocks)."""
-    fn_pattern = re.compile(r"^\s*(pub\s+)?(fn\s+\w+)")
-    lines = source.splitlines()
-
-    fn_start: Optional[tuple[int, str]] = None
-    depth = 0
-
-    for i, raw in enumerate(lines, 1):
-        m = fn_pattern.match(raw)
-        if m and not in_test_block(i, spans):
-            fn_start = (i, m.group(0).strip())
-
-        depth += raw.count("{") - raw.count("}")
-
-        if fn_start and depth == 0:
-            length = i - fn_start[0]
-            if length > 120:
-                result.add(
-                    rel_path,
-                    fn_start[0],
-                    "Complexity",
-                    f"Function `{fn_start[1]}` is {length} lines long (> 120)",
-                    "LONG_FN",
-                )
-            fn_start = None
+    for start, end, signature in fn_spans:
+        length = end - start
+        if length > 120:
+            result.add(
+                rel_path,
+                start,
+                "Complexity",
+                f"Function `{signature}` is {length} lines long (> 120)",
+                "LONG_FN",
+            )
 
 
 def check_magic_numbers(
-    source: str, rel_path: str, spans: list[tuple[int, int, bool]], result: AuditResult
+    lines: list[str], stripped_lines: list[str], rel_path: str, test_mask: bytearray, result: AuditResult
 ) -> None:
     """Flag bare numeric literals > 9 that aren't obviously constants."""
     # Only check production code; skip test blocks and comment lines
-    pattern = re.compile(r"\b(\d{2,})\b")
     # Acceptable: version strings, byte sizes, offsets in location.rs
     skip_files = {"location.rs"}
     if any(rel_path.endswith(s) for s in skip_files):
         return
 
-    for i, raw in enumerate(source.splitlines(), 1):
-        stripped = raw.strip()
+    for i, (raw, stripped) in enumerate(zip(lines, stripped_lines), 1):
         if is_comment(stripped):
             continue
-        if in_test_block(i, spans):
+        if test_mask[i]:
             continue
         # Skip lines with obvious constants/sizes/capacities
         if any(kw in raw for kw in ["capacity", "with_capacity", "reserve", "len()", "usize", "u32", "u64", "i32", "i64", "const "]):
             continue
-        for m in pattern.finditer(raw):
+        for m in MAGIC_RE.finditer(raw):
             val = int(m.group(1))
             # Skip small-ish numbers and year-like numbers
             if val > 100 and not (1990 <= val <= 2100):
@@ -284,39 +468,99 @@ def check_magic_numbers(
 # Main audit
 # ---------------------------------------------------------------------------
 
-def audit_file(path: Path) -> list[Issue]:
-    rel = str(path.relative_to(REPO_ROOT))
-    try:
-        source = path.read_text(encoding="utf-8")
-    except Exception as e:
-        print(f"  SKIP {rel}: {e}", file=sys.stderr)
-        return []
-
+def audit_source(source: str, rel: str) -> list[Issue]:
     result = AuditResult()
-    spans = parse_blocks(source)
-
-    check_unwrap_expect_panic(source, rel, spans, result)
-    check_debug_macros(source, rel, spans, result)
-    check_todo_fixme(source, rel, result)
-    check_missing_file_doc(source, rel, result)
-    check_large_functions(source, rel, spans, result)
+    # Split and strip once; every checker below shares these lists.
+    lines = source.splitlines()
+    stripped_lines = [line.strip() for line in lines]
+    deltas = brace_deltas(lines)
+    spans, fn_spans = parse_blocks(stripped_lines, deltas)
+    test_mask = build_test_mask(spans, len(lines))
+
+    hits = scan_tokens(source, lines)
+    if hits:
+        check_lines(hits, lines, stripped_lines, rel, test_mask, result)
+    check_missing_file_doc(stripped_lines, rel, result)
+    check_large_functions(fn_spans, rel, result)
     # check_magic_numbers is noisy; enable selectively
-    # check_magic_numbers(source, rel, spans, result)
+    # check_magic_numbers(lines, stripped_lines, rel, test_mask, result)
 
     return result.issues
 
 
-def main() -> int:
-    print("=" * 68)
-    print("  REAPER PRODUCTION CODE AUDIT")
-    print("=" * 68)
-    print(f"  Scanning {len(SRC_FILES)} source files under {REPO_ROOT / 'src'}")
-    print()
+def audit_file(path: Path, cached: Optional[CacheEntry] = None) -> Optional[CacheEntry]:
+    """Audit one file, reusing *cached* issues when its contents are unchanged.
+
+    Returns None if the file could not be read.
+    """
+    rel = str(path.relative_to(REPO_ROOT))
+    try:
+        # fstat the descriptor we read from, so the cached key always
+        # describes exactly these bytes even if the file is being rewritten.
+        with path.open("rb") as f:
+            key = stat_key(os.fstat(f.fileno()))
+            data = f.read()
+        source = data.decode("utf-8")
+    except Exception as e:
+        print(f"  SKIP {rel}: {e}", file=sys.stderr)
+        return None
+
+    digest = hashlib.blake2b(data).hexdigest()
+    if cached is not None and cached.digest == digest:
+        # Touched but not modified: refresh the stat key, keep the issues.
+        return CacheEntry(key, digest, cached.issues)
+    return CacheEntry(key, digest, audit_source(source, rel))
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Audit Reaper's Rust source for production-code issues.")
+    parser.add_argument("--no-cache", action="store_true", help=f"ignore and do not update {CACHE_PATH.name}")
+    args = parser.parse_args(argv)
+
+    # Walked once here; workers only ever receive the paths they must scan.
+    sources = discover_sources(SRC_DIR)
+
+    # The report is collected here and written in one go at the end.
+    out: list[str] = []
+    out.append("=" * 68)
+    out.append("  REAPER PRODUCTION CODE AUDIT")
+    out.append("=" * 68)
+    out.append(f"  Scanning {len(sources)} source files under {SRC_DIR}")
+    out.append("")
+
+    cache = {} if args.no_cache else load_cache()
+    entries: dict[str, CacheEntry] = {}
+    pending: list[Path] = []
+    for path, st in sources:
+        # Fast path: an unchanged (mtime, size) means we never open the file.
+        entry = cache.get(str(path))
+        if entry is not None and entry.key == stat_key(st):
+            entries[str(path)] = entry
+        else:
+            pending.append(path)
+
+    stale = [cache.get(str(path)) for path in pending]
+    if len(pending) < PARALLEL_MIN_FILES:
+        fresh = list(map(audit_file, pending, stale))
+    else:
+        # Files are independent, so fan them out across all cores.
+        # ex.map() preserves input order, keeping the report stable.
+        workers = os.cpu_count() or 1
+        chunksize = max(1, len(pending) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as ex:
+            fresh = list(ex.map(audit_file, pending, stale, chunksize=chunksize))
+    for path, entry in zip(pending, fresh):
+        if entry is not None:
+            entries[str(path)] = entry
+
+    if not args.no_cache:
+        save_cache(entries)
 
     all_issues: list[Issue] = []
-    for path in SRC_FILES:
-        issues = audit_file(path)
-        all_issues.extend(issues)
+    for path, _ in sources:
+        entry = entries.get(str(path))
+        if entry is not None:
+            all_issues.extend(entry.issues)
 
     # ── Categorised output ────────────────────────────────────────────────────
     categories = [
@@ -333,43 +577,47 @@ def main() -> int:
         ("LONG_FN",     "🔵 Long function (>120 lines)"),
     ]
 
+    # Group once; both the categorised output and the summary read from this.
+    by_code: dict[str, list[Issue]] = {}
+    for issue in all_issues:
+        by_code.setdefault(issue.code, []).append(issue)
+
     found_any = False
     for code, label in categories:
-        items = [x for x in all_issues if x.code == code]
+        items = by_code.get(code)
         if not items:
             continue
         found_any = True
-        print(f"{label}  ({len(items)} occurrence{'s' if len(items) != 1 else ''})")
-        print("  " + "─" * 64)
-        for issue in items:
-            print(f"  {issue}")
-        print()
+        out.append(f"{label}  ({len(items)} occurrence{'s' if len(items) != 1 else ''})")
+        out.append("  " + "─" * 64)
+        out.extend(f"  {issue}" for issue in items)
+        out.append("")
 
     # ── Summary ───────────────────────────────────────────────────────────────
-    print("=" * 68)
-    summary = {}
-    for issue in all_issues:
-        summary[issue.code] = summary.get(issue.code, 0) + 1
+    out.append("=" * 68)
+    summary = {code: len(items) for code, items in by_code.items()}
 
     blocking = sum(summary.get(c, 0) for c in ("UNWRAP", "PANIC", "FIXME"))
     warnings = sum(summary.get(c, 0) for c in ("DBG", "EPRINTLN", "TODO", "HACK", "XXX"))
     info     = sum(summary.get(c, 0) for c in ("EXPECT_INFO", "NO_DOC", "LONG_FN"))
 
-    print(f"  Blocking issues  : {blocking}")
-    print(f"  Warnings         : {warnings}")
-    print(f"  Info / style     : {info}")
-    print(f"  Total            : {len(all_issues)}")
-    print()
+    out.append(f"  Blocking issues  : {blocking}")
+    out.append(f"  Warnings         : {warnings}")
+    out.append(f"  Info / style     : {info}")
+    out.append(f"  Total            : {len(all_issues)}")
+    out.append("")
 
     if blocking == 0 and warnings == 0:
-        print("  ✅  No blocking or warning issues found.")
+        out.append("  ✅  No blocking or warning issues found.")
     elif blocking == 0:
-        print(f"  ⚠️   No blocking issues.  {warnings} warning(s) to review.")
+        out.append(f"  ⚠️   No blocking issues.  {warnings} warning(s) to review.")
     else:
-        print(f"  ❌  {blocking} blocking issue(s) must be resolved before release.")
+        out.append(f"  ❌  {blocking} blocking issue(s) must be resolved before release.")
+
+    out.append("=" * 68)
+    out.append("")
 
-    print("=" * 68)
-    print()
+    sys.stdout.write("\n".join(out) + "\n")
 
     return 1 if blocking > 0 else 0
 
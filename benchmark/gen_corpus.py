@@ -19,25 +19,68 @@ Pattern coverage (vs previous corpus):
        multiple inheritance, __init_subclass__, __class_getitem__, f-strings,
        star-unpacking, exception chaining, typing extensions (Literal, Final,
        TypedDict, ParamSpec, Concatenate), overloaded functions, slots classes,
-       cached_property, ChainMap, deque, heapq, bisect, conditional imports.
+       cached_property, ChainMap, deque, bisect, conditional imports.
 """
 
+from __future__ import annotations
+
 import os
-import textwrap
+from functools import lru_cache
+from typing import TYPE_CHECKING, Callable, Optional
+
+# Only what the template definitions need is imported eagerly; the writer
+# and driver import the rest on first use, keeping a bare import cheap.
+if TYPE_CHECKING:
+    import tarfile
+    from concurrent.futures import ProcessPoolExecutor
 
 ROOT = os.path.dirname(__file__)
-SMALL_DIR  = os.path.join(ROOT, "corpus", "small")
-MEDIUM_DIR = os.path.join(ROOT, "corpus", "medium")
-LARGE_DIR  = os.path.join(ROOT, "corpus", "large")
-EDGE_DIR   = os.path.join(ROOT, "corpus", "edge_cases")
+CORPUS_DIR = os.path.join(ROOT, "corpus")
+SMALL_DIR  = os.path.join(CORPUS_DIR, "small")
+MEDIUM_DIR = os.path.join(CORPUS_DIR, "medium")
+LARGE_DIR  = os.path.join(CORPUS_DIR, "large")
+EDGE_DIR   = os.path.join(CORPUS_DIR, "edge_cases")
+MANIFEST_PATH = os.path.join(CORPUS_DIR, "MANIFEST.json")
+
+# Every output gets this mtime, so regenerating an unchanged corpus leaves
+# the files indistinguishable to mtime-based tooling; MANIFEST.json carries
+# a sha256 per file for content comparison.
+STABLE_MTIME = 1_700_000_000
 
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Small modules — one dominant pattern per file
+#
+# Templates are plain module-level strings written in str.format syntax, so
+# the literal body is built once at import instead of on every call.
 # ─────────────────────────────────────────────────────────────────────────────
 
-def _small_async(i: int) -> str:
-    return f'''\
+@lru_cache(maxsize=None)
+def _compile_template(tmpl: str) -> str:
+    """Rewrite a format-syntax template for _fill: unescape {{ and }} and
+    turn each {name} into a NUL-delimited marker."""
+    import string
+
+    out = []
+    for literal, name, spec, conv in string.Formatter().parse(tmpl):
+        out.append(literal)
+        if name is not None:
+            assert not spec and not conv, "templates use bare {name} fields"
+            out.append(f"\0{name}\0")
+    return "".join(out)
+
+
+def _fill(tmpl: str, fields: dict[str, int]) -> str:
+    """Equivalent to tmpl.format_map(fields) for bare integer fields, but
+    each render is one str.replace per field over a precompiled body rather
+    than a re-parse of the whole format string."""
+    out = _compile_template(tmpl)
+    for name, value in fields.items():
+        out = out.replace(f"\0{name}\0", str(value))
+    return out
+
+
+_TMPL_ASYNC = '''\
 """Module {i}: async/await patterns."""
 from __future__ import annotations
 import asyncio
@@ -90,8 +133,12 @@ if __name__ == "__main__":
 '''
 
 
-def _small_dataclass(i: int) -> str:
-    return f'''\
+@lru_cache(maxsize=None)
+def _small_async(i: int) -> str:
+    return _fill(_TMPL_ASYNC, {"i": i})
+
+
+_TMPL_DATACLASS = '''\
 """Module {i}: dataclass patterns."""
 from __future__ import annotations
 import dataclasses
@@ -102,7 +149,7 @@ from typing import ClassVar, Optional
 _VERSION = "1.0.{i}"   # used in class body
 
 
-@dataclass
+@dataclass(slots=True)
 class Config_{i}:
     """Used — instantiated below."""
     host: str
@@ -113,7 +160,7 @@ class Config_{i}:
     KW_ONLY: ClassVar[None] = None          # just to reference the import
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Coordinate_{i}:
     """Used — created below."""
     x: float
@@ -126,7 +173,7 @@ class Coordinate_{i}:
         return ((self.x - other.x) ** 2 + (self.y - other.y) ** 2) ** 0.5
 
 
-@dataclass
+@dataclass(slots=True)
 class UnusedRecord_{i}:
     """Never used — RP004."""
     name: str
@@ -148,23 +195,24 @@ print(_label, _dist)
 '''
 
 
-def _small_enum(i: int) -> str:
-    return f'''\
+@lru_cache(maxsize=None)
+def _small_dataclass(i: int) -> str:
+    return _fill(_TMPL_DATACLASS, {"i": i})
+
+
+_TMPL_ENUM = '''\
 """Module {i}: enum patterns."""
 from __future__ import annotations
 import enum
 from enum import Enum, IntEnum, Flag, auto
 import functools
 
-_PREFIX = "STATUS"   # used in Status body
-
-
 class Status_{i}(Enum):
     """Used — referenced below."""
-    PENDING  = f"{{_PREFIX}}_PENDING"
-    RUNNING  = f"{{_PREFIX}}_RUNNING"
-    DONE     = f"{{_PREFIX}}_DONE"
-    FAILED   = f"{{_PREFIX}}_FAILED"
+    PENDING  = "STATUS_PENDING"
+    RUNNING  = "STATUS_RUNNING"
+    DONE     = "STATUS_DONE"
+    FAILED   = "STATUS_FAILED"
 
     def is_terminal(self) -> bool:
         return self in (Status_{i}.DONE, Status_{i}.FAILED)
@@ -204,8 +252,12 @@ print(label, current.is_terminal(), perms)
 '''
 
 
-def _small_protocol(i: int) -> str:
-    return f'''\
+@lru_cache(maxsize=None)
+def _small_enum(i: int) -> str:
+    return _fill(_TMPL_ENUM, {"i": i})
+
+
+_TMPL_PROTOCOL = '''\
 """Module {i}: Protocol / TypeVar / Generic patterns."""
 from __future__ import annotations
 from typing import Protocol, TypeVar, Generic, runtime_checkable, Iterator
@@ -279,17 +331,18 @@ assert isinstance(Circle_{i}(1.0), Drawable_{i})
 '''
 
 
-def _small_properties(i: int) -> str:
-    return f'''\
+@lru_cache(maxsize=None)
+def _small_protocol(i: int) -> str:
+    return _fill(_TMPL_PROTOCOL, {"i": i})
+
+
+_TMPL_PROPERTIES = '''\
 """Module {i}: @property, @classmethod, @staticmethod, __slots__."""
 from __future__ import annotations
 import math
 import weakref
 from typing import Optional
 
-_DEFAULT_PRECISION = 6   # used in Vector body
-
-
 class Vector_{i}:
     """Used — instantiated below."""
     __slots__ = ("_x", "_y", "_z")
@@ -320,8 +373,7 @@ class Vector_{i}:
         return cls(*t[:3])
 
     def __repr__(self) -> str:
-        prec = _DEFAULT_PRECISION
-        return f"Vector({{self._x:.{{prec}}g}}, {{self._y:.{{prec}}g}}, {{self._z:.{{prec}}g}})"
+        return f"Vector({{self._x:.6g}}, {{self._y:.6g}}, {{self._z:.6g}})"
 
     def dot(self, other: "Vector_{i}") -> float:
         return self._x * other._x + self._y * other._y + self._z * other._z
@@ -349,8 +401,12 @@ print(repr(v1), repr(v2), repr(v0), _dot, _ref)
 '''
 
 
-def _small_comprehensions(i: int) -> str:
-    return f'''\
+@lru_cache(maxsize=None)
+def _small_properties(i: int) -> str:
+    return _fill(_TMPL_PROPERTIES, {"i": i})
+
+
+_TMPL_COMPREHENSIONS = '''\
 """Module {i}: comprehensions, walrus, generator expressions."""
 from __future__ import annotations
 import itertools
@@ -358,7 +414,7 @@ import collections
 import statistics
 from typing import Iterable
 
-_THRESHOLD_{i} = {i * 3 + 10}   # used in filter
+_THRESHOLD_{i} = {threshold}   # used in filter
 
 
 def process_stream_{i}(data: Iterable[int]) -> dict[str, float]:
@@ -401,13 +457,18 @@ def unused_reducer_{i}(seq: list[int], start: int, padding: str) -> int:
     return dead
 
 
-result_{i} = process_stream_{i}(range(1, {i + 20}))
+result_{i} = process_stream_{i}(range(1, {stop}))
 print(result_{i})
 '''
 
 
-def _small_try_import(i: int) -> str:
-    return f'''\
+@lru_cache(maxsize=None)
+def _small_comprehensions(i: int) -> str:
+    return _fill(_TMPL_COMPREHENSIONS,
+                 {"i": i, "threshold": i * 3 + 10, "stop": i + 20})
+
+
+_TMPL_TRY_IMPORT = '''\
 """Module {i}: try/except import fallbacks and conditional imports."""
 from __future__ import annotations
 import sys
@@ -461,14 +522,18 @@ print(cfg_result_{i})
 '''
 
 
-def _small_namedtuple(i: int) -> str:
-    return f'''\
+@lru_cache(maxsize=None)
+def _small_try_import(i: int) -> str:
+    return _fill(_TMPL_TRY_IMPORT, {"i": i})
+
+
+_TMPL_NAMEDTUPLE = '''\
 """Module {i}: NamedTuple, TypedDict, Literal, Final."""
 from __future__ import annotations
 from typing import NamedTuple, TypedDict, Literal, Final, NotRequired
 import operator
 
-MAX_RETRIES: Final[int] = {i + 3}
+MAX_RETRIES: Final[int] = {retries}
 Direction = Literal["north", "south", "east", "west"]
 
 
@@ -507,14 +572,19 @@ def unused_sorter_{i}(pts: list[Point_{i}], reverse: bool, key_fn: object) -> li
 
 
 origin_{i} = Point_{i}(0.0, 0.0, "origin")
-opts_{i}: ConnOptions_{i} = {{"host": "localhost", "port": {8000 + i}}}
+opts_{i}: ConnOptions_{i} = {{"host": "localhost", "port": {port}}}
 addr_{i} = connect_{i}(opts_{i})
 print(origin_{i}, addr_{i})
 '''
 
 
-def _small_abc(i: int) -> str:
-    return f'''\
+@lru_cache(maxsize=None)
+def _small_namedtuple(i: int) -> str:
+    return _fill(_TMPL_NAMEDTUPLE,
+                 {"i": i, "retries": i + 3, "port": 8000 + i})
+
+
+_TMPL_ABC = '''\
 """Module {i}: ABC, abstractmethod, __init_subclass__, multiple inheritance."""
 from __future__ import annotations
 import abc
@@ -590,8 +660,12 @@ print(output_{i}, _REGISTRY_{i})
 '''
 
 
-def _small_contextmanager(i: int) -> str:
-    return f'''\
+@lru_cache(maxsize=None)
+def _small_abc(i: int) -> str:
+    return _fill(_TMPL_ABC, {"i": i})
+
+
+_TMPL_CONTEXTMANAGER = '''\
 """Module {i}: contextmanager, __enter__/__exit__, ExitStack."""
 from __future__ import annotations
 import contextlib
@@ -658,8 +732,12 @@ with ManagedBuffer_{i}(64) as buf_{i}:
 '''
 
 
-def _small_global_nonlocal(i: int) -> str:
-    return f'''\
+@lru_cache(maxsize=None)
+def _small_contextmanager(i: int) -> str:
+    return _fill(_TMPL_CONTEXTMANAGER, {"i": i})
+
+
+_TMPL_GLOBAL_NONLOCAL = '''\
 """Module {i}: global, nonlocal, closures, mutable-default trap."""
 from __future__ import annotations
 from typing import Callable
@@ -712,24 +790,29 @@ print(add5_{i}(10), _COUNTER_{i}, _LOG_{i})
 '''
 
 
-def _small_match(i: int) -> str:
-    return f'''\
+@lru_cache(maxsize=None)
+def _small_global_nonlocal(i: int) -> str:
+    return _fill(_TMPL_GLOBAL_NONLOCAL, {"i": i})
+
+
+_TMPL_MATCH = '''\
 """Module {i}: match/case (structural pattern matching, Python ≥3.10)."""
 from __future__ import annotations
+import sys
 from dataclasses import dataclass
 from typing import Union
 
-@dataclass
+@dataclass(slots=True)
 class Point_{i}:
     x: float
     y: float
 
-@dataclass
+@dataclass(slots=True)
 class Circle_{i}:
     center: Point_{i}
     radius: float
 
-@dataclass
+@dataclass(slots=True)
 class Rectangle_{i}:
     top_left: Point_{i}
     bottom_right: Point_{i}
@@ -786,14 +869,19 @@ shapes_{i}: list[Shape_{i}] = [
     Circle_{i}(Point_{i}(1.0, 2.0), 5.0),
     Rectangle_{i}(Point_{i}(0.0, 0.0), Point_{i}(3.0, 4.0)),
 ]
-for _s in shapes_{i}:
-    print(describe_shape_{i}(_s))
-print(classify_command_{i}({{"action": "run", "target": "tests"}}))
+_lines_{i} = [describe_shape_{i}(_s) for _s in shapes_{i}]
+_lines_{i}.append(classify_command_{i}({{"action": "run", "target": "tests"}}))
+sys.stdout.write("\\n".join(_lines_{i}) + "\\n")
 '''
 
 
-# Map of small-module flavour names → generator functions
-SMALL_FLAVOURS = [
+@lru_cache(maxsize=None)
+def _small_match(i: int) -> str:
+    return _fill(_TMPL_MATCH, {"i": i})
+
+
+# Small-module generators, dispatched by index (read-only, so a tuple)
+SMALL_FLAVOURS = (
     _small_async,
     _small_dataclass,
     _small_enum,
@@ -806,23 +894,25 @@ SMALL_FLAVOURS = [
     _small_contextmanager,
     _small_global_nonlocal,
     _small_match,
-]
+)
 
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Medium modules — realistic service/library modules (~200 lines)
+#
+# Each template is split into docstring / import header / body. The header
+# has no placeholders, so it is spliced in verbatim rather than formatted.
 # ─────────────────────────────────────────────────────────────────────────────
 
-def _medium_cache_service(i: int) -> str:
-    return f'''\
-"""Medium module {i}: cache service with TTL, eviction, and metrics."""
+_TMPL_MED_CACHE_DOC = '"""Medium module {i}: cache service with TTL, eviction, and metrics."""\n'
+
+_MED_CACHE_IMPORTS = '''\
 from __future__ import annotations
 import time
 import threading
-import hashlib
 import pickle
 import weakref
-import heapq
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from typing import Any, Callable, Generic, Iterator, Optional, TypeVar
 from functools import wraps
@@ -831,10 +921,12 @@ V = TypeVar("V")
 
 _DEFAULT_TTL    = 300
 _DEFAULT_MAX    = 1024
-_HASH_ALG       = "sha256"     # used in CacheKey
 
 
-@dataclass(order=True)
+'''
+
+_TMPL_MED_CACHE_BODY = '''\
+@dataclass(order=True, slots=True)
 class CacheEntry_{i}(Generic[V]):
     expires_at: float
     key: str = field(compare=False)
@@ -848,49 +940,33 @@ class TTLCache_{i}(Generic[V]):
     def __init__(self, ttl: float = _DEFAULT_TTL, maxsize: int = _DEFAULT_MAX) -> None:
         self._ttl    = ttl
         self._max    = maxsize
-        self._store: dict[str, CacheEntry_{i}[V]] = {{}}
-        self._heap:  list[CacheEntry_{i}[V]] = []
+        self._store: OrderedDict[str, CacheEntry_{i}[V]] = OrderedDict()
         self._lock   = threading.RLock()
         self._hits   = 0
         self._misses = 0
 
-    def _make_key(self, raw: str) -> str:
-        h = hashlib.new(_HASH_ALG)
-        h.update(raw.encode())
-        return h.hexdigest()
-
     def get(self, key: str) -> Optional[V]:
-        k = self._make_key(key)
         with self._lock:
-            entry = self._store.get(k)
+            entry = self._store.get(key)
             if entry is None or entry.expires_at < time.monotonic():
                 self._misses += 1
                 return None
+            self._store.move_to_end(key)
             entry.hits += 1
             self._hits += 1
             return entry.value
 
     def set(self, key: str, value: V, ttl: Optional[float] = None) -> None:
-        k   = self._make_key(key)
         exp = time.monotonic() + (ttl or self._ttl)
         with self._lock:
-            if len(self._store) >= self._max:
-                self._evict_one()
-            entry = CacheEntry_{i}(expires_at=exp, key=k, value=value)
-            self._store[k] = entry
-            heapq.heappush(self._heap, entry)
-
-    def _evict_one(self) -> None:
-        while self._heap:
-            oldest = heapq.heappop(self._heap)
-            if oldest.key in self._store:
-                del self._store[oldest.key]
-                return
+            if key not in self._store and len(self._store) >= self._max:
+                self._store.popitem(last=False)
+            self._store[key] = CacheEntry_{i}(expires_at=exp, key=key, value=value)
+            self._store.move_to_end(key)
 
     def invalidate(self, key: str) -> bool:
-        k = self._make_key(key)
         with self._lock:
-            return self._store.pop(k, None) is not None
+            return self._store.pop(key, None) is not None
 
     @property
     def stats(self) -> dict[str, int]:
@@ -907,16 +983,17 @@ class TTLCache_{i}(Generic[V]):
 def cached_{i}(ttl: float = _DEFAULT_TTL) -> Callable:
     """Decorator — used below."""
     def decorator(fn: Callable) -> Callable:
-        _cache: TTLCache_{i}[Any] = TTLCache_{i}(ttl=ttl)
+        _memo: dict[tuple, tuple[float, Any]] = {{}}
 
         @wraps(fn)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
-            key_src = repr(args) + repr(sorted(kwargs.items()))
-            hit = _cache.get(key_src)
-            if hit is not None:
-                return hit
+            key = (args, tuple(sorted(kwargs.items())))
+            now = time.monotonic()
+            hit = _memo.get(key)
+            if hit is not None and hit[0] >= now:
+                return hit[1]
             result = fn(*args, **kwargs)
-            _cache.set(key_src, result)
+            _memo[key] = (now + ttl, result)
             return result
         return wrapper
     return decorator
@@ -932,7 +1009,7 @@ def _internal_cleanup_{i}(cache: TTLCache_{i}[Any]) -> int:
     """Private — exempt from RP003."""
     now = time.monotonic()
     removed = 0
-    keys_to_del = [e.key for e in cache._heap if e.expires_at < now]
+    keys_to_del = [e.key for e in cache._store.values() if e.expires_at < now]
     for k in keys_to_del:
         cache._store.pop(k, None)
         removed += 1
@@ -966,14 +1043,24 @@ def unused_weak_proxy_{i}(obj: Any, label: str) -> None:
 
 _shared_cache_{i}: TTLCache_{i}[list[float]] = TTLCache_{i}(ttl=120.0, maxsize=256)
 _shared_cache_{i}.set("pi", [3.14159, 2.71828])
-_val_{i} = expensive_compute_{i}({i + 5}, 1.5)
+_val_{i} = expensive_compute_{i}({n}, 1.5)
 print(_shared_cache_{i}.stats, len(_val_{i}))
 '''
 
 
-def _medium_pipeline(i: int) -> str:
-    return f'''\
-"""Medium module {i}: data pipeline with stages, transforms, and error handling."""
+@lru_cache(maxsize=None)
+def _medium_cache_service(i: int) -> str:
+    fields = {"i": i, "n": i + 5}
+    return "".join((
+        _fill(_TMPL_MED_CACHE_DOC, fields),
+        _MED_CACHE_IMPORTS,
+        _fill(_TMPL_MED_CACHE_BODY, fields),
+    ))
+
+
+_TMPL_MED_PIPELINE_DOC = '"""Medium module {i}: data pipeline with stages, transforms, and error handling."""\n'
+
+_MED_PIPELINE_IMPORTS = '''\
 from __future__ import annotations
 import abc
 import csv
@@ -987,11 +1074,14 @@ from typing import Any, Callable, ClassVar, Generator, Iterator
 
 log = logging.getLogger(__name__)
 
+'''
+
+_TMPL_MED_PIPELINE_BODY = '''\
 _VERSION_{i}   = "0.{i}.0"
 _MAX_ERRORS = 100
 
 
-@dataclass
+@dataclass(slots=True)
 class Record_{i}:
     data:  dict[str, Any]
     index: int
@@ -1121,10 +1211,21 @@ print(_pipe_{i}.error_summary, [r.data for r in _out_{i}])
 '''
 
 
+@lru_cache(maxsize=None)
+def _medium_pipeline(i: int) -> str:
+    fields = {"i": i}
+    return "".join((
+        _fill(_TMPL_MED_PIPELINE_DOC, fields),
+        _MED_PIPELINE_IMPORTS,
+        _fill(_TMPL_MED_PIPELINE_BODY, fields),
+    ))
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Large modules — heavy real-world modules (~600 lines)
 # ─────────────────────────────────────────────────────────────────────────────
 
+@lru_cache(maxsize=None)
 def _large_orm(i: int) -> str:
     """Simulates a mini ORM with model, query-builder, migrations."""
     return f'''\
@@ -1139,7 +1240,6 @@ import logging
 import re
 import sqlite3
 import threading
-import time
 import weakref
 from collections import defaultdict
 from contextlib import contextmanager
@@ -1168,6 +1268,9 @@ class FieldType_{i}(Enum):
     JSON     = auto()
 
 
+_VALID_FIELD_TYPES_{i} = frozenset(FieldType_{i})
+
+
 class Ordering_{i}(Enum):
     ASC  = "ASC"
     DESC = "DESC"
@@ -1211,26 +1314,51 @@ class ConnectionPool_{i}:
     def __init__(self, db_path: str, maxconn: int = 5) -> None:
         self._path    = db_path
         self._max     = maxconn
-        self._lock    = threading.Lock()
+        self._cv      = threading.Condition()
         self._all:    list[sqlite3.Connection] = []
         self._free:   list[sqlite3.Connection] = []
         self._refs:   weakref.WeakValueDictionary = weakref.WeakValueDictionary()
+        # Per-thread parking slot, keyed by thread id: a thread re-borrows its
+        # own connection without taking _cv. A plain threading.local would hide
+        # idle connections from waiters in other threads, so it is a dict they
+        # can steal from. Single-key dict ops are atomic under the GIL.
+        self._parked: dict[int, sqlite3.Connection] = {{}}
+        self._waiting = 0
 
     def acquire(self) -> sqlite3.Connection:
-        with self._lock:
+        conn = self._parked.pop(threading.get_ident(), None)
+        if conn is not None:
+            return conn
+        with self._cv:
+            # Sleep on the condition until release() notifies. The wait is
+            # bounded because release() reads _waiting without the lock:
+            # one that races our increment parks its connection instead of
+            # notifying, and only a timed wake will re-check _parked for it.
+            while not self._free and len(self._all) >= self._max:
+                try:
+                    return self._parked.popitem()[1]
+                except KeyError:
+                    pass
+                self._waiting += 1
+                self._cv.wait(0.05)
+                self._waiting -= 1
             if self._free:
                 return self._free.pop()
-            if len(self._all) < self._max:
-                conn = sqlite3.connect(self._path, check_same_thread=False)
-                conn.row_factory = sqlite3.Row
-                self._all.append(conn)
-                return conn
-        time.sleep(0.01)
-        return self.acquire()
+            conn = sqlite3.connect(
+                self._path, check_same_thread=False, cached_statements=256,
+            )
+            conn.row_factory = sqlite3.Row
+            self._all.append(conn)
+            return conn
 
     def release(self, conn: sqlite3.Connection) -> None:
-        with self._lock:
+        tid = threading.get_ident()
+        if not self._waiting and tid not in self._parked:
+            self._parked[tid] = conn
+            return
+        with self._cv:
             self._free.append(conn)
+            self._cv.notify()
 
     @contextmanager
     def connection(self) -> Generator[sqlite3.Connection, None, None]:
@@ -1245,11 +1373,12 @@ class ConnectionPool_{i}:
             self.release(conn)
 
     def close_all(self) -> None:
-        with self._lock:
+        with self._cv:
             for conn in self._all:
                 conn.close()
             self._all.clear()
             self._free.clear()
+            self._parked.clear()
 
 
 # ── ModelMeta ─────────────────────────────────────────────────────────────────
@@ -1260,10 +1389,10 @@ class ModelMeta_{i}(type):
         fields: dict[str, Field_{i}] = {{}}
         for b in bases:
             fields.update(getattr(b, "_fields_{i}", {{}}))
-        for attr, val in list(ns.items()):
-            if isinstance(val, Field_{i}):
-                fields[attr] = val
-                ns.pop(attr)
+        own = {{k: v for k, v in ns.items() if isinstance(v, Field_{i})}}
+        for k in own:
+            del ns[k]
+        fields.update(own)
         ns[f"_fields_{i}"] = fields
         return super().__new__(mcs, name, bases, ns)
 
@@ -1303,8 +1432,17 @@ class Model_{i}(metaclass=ModelMeta_{i}):
         ]
         return f"CREATE TABLE IF NOT EXISTS {{cls.table_name()}} ({{', '.join(fragments)}})"
 
-    def to_dict(self) -> dict[str, Any]:
-        return copy.deepcopy(self._data)
+    @classmethod
+    @lru_cache(maxsize=32)
+    def insert_sql(cls, cols: tuple[str, ...]) -> str:
+        """One INSERT string per column set so sqlite reuses the statement."""
+        phs = ", ".join("?" * len(cols))
+        return f"INSERT INTO {{cls.table_name()}} ({{', '.join(cols)}}) VALUES ({{phs}})"
+
+    def to_dict(self, deep: bool = False) -> dict[str, Any]:
+        # Row values are primitives; only JSON fields holding containers
+        # need deep=True.
+        return copy.deepcopy(self._data) if deep else dict(self._data)
 
     def to_json(self) -> str:
         return json.dumps(self._data)
@@ -1349,20 +1487,30 @@ class QuerySet_{i}(Generic[T]):
         self._order: Optional[tuple[str, Ordering_{i}]] = None
         self._limit: Optional[int] = None
 
+    def _clone(self) -> "QuerySet_{i}[T]":
+        qs = QuerySet_{i}.__new__(QuerySet_{i})
+        qs._model  = self._model
+        qs._pool   = self._pool
+        qs._where  = self._where[:]
+        qs._params = self._params[:]
+        qs._order  = self._order
+        qs._limit  = self._limit
+        return qs
+
     def filter(self, **kwargs: Any) -> "QuerySet_{i}[T]":
-        qs = copy.copy(self)
+        qs = self._clone()
         for k, v in kwargs.items():
             qs._where.append(f"{{k}} = ?")
             qs._params.append(v)
         return qs
 
     def order_by(self, col: str, direction: Ordering_{i} = Ordering_{i}.ASC) -> "QuerySet_{i}[T]":
-        qs = copy.copy(self)
+        qs = self._clone()
         qs._order = (col, direction)
         return qs
 
     def limit(self, n: int) -> "QuerySet_{i}[T]":
-        qs = copy.copy(self)
+        qs = self._clone()
         qs._limit = n
         return qs
 
@@ -1374,9 +1522,12 @@ class QuerySet_{i}(Generic[T]):
         if self._order:
             col, d = self._order
             sql += f" ORDER BY {{col}} {{d.value}}"
+        params = list(self._params)
         if self._limit is not None:
-            sql += f" LIMIT {{self._limit}}"
-        return sql, list(self._params)
+            # Bound, not interpolated, so every limit shares one cached statement.
+            sql += " LIMIT ?"
+            params.append(self._limit)
+        return sql, params
 
     def all(self) -> list[T]:
         sql, params = self._build_sql()
@@ -1407,13 +1558,25 @@ class Session_{i}:
 
     def create(self, model: type[T], **kwargs: Any) -> T:
         obj   = model(**kwargs)
-        cols  = ", ".join(obj._data.keys())
-        phs   = ", ".join("?" * len(obj._data))
-        sql   = f"INSERT INTO {{model.table_name()}} ({{cols}}) VALUES ({{phs}})"
+        sql   = model.insert_sql(tuple(obj._data))
         with self._pool.connection() as conn:
             conn.execute(sql, list(obj._data.values()))
         return obj
 
+    def create_many(self, model: type[T], rows: list[dict[str, Any]]) -> list[T]:
+        """Insert rows in one transaction, one executemany per column shape."""
+        objs = [model(**row) for row in rows]
+        shapes: dict[tuple[str, ...], list[T]] = defaultdict(list)
+        for obj in objs:
+            shapes[tuple(obj._data)].append(obj)
+        with self._pool.connection() as conn:
+            for cols, group in shapes.items():
+                conn.executemany(
+                    model.insert_sql(cols),
+                    [tuple(o._data.values()) for o in group],
+                )
+        return objs
+
     def init_schema(self, *models: type[Model_{i}]) -> None:
         with self._pool.connection() as conn:
             for m in models:
@@ -1428,7 +1591,7 @@ class Session_{i}:
 
 @lru_cache(maxsize=64)
 def _hash_schema_{i}(ddl: str) -> str:
-    return hashlib.sha256(ddl.encode()).hexdigest()[:16]
+    return hashlib.blake2b(ddl.encode(), digest_size=8).hexdigest()
 
 
 def unused_migration_runner_{i}(
@@ -1467,7 +1630,7 @@ def coerce_{i}(value: int)  -> int: ...
 @overload
 def coerce_{i}(value: None) -> None: ...
 def coerce_{i}(value: Union[str, int, None]) -> Union[str, int, None]:
-    """Used in footer."""
+    """Used by coerce_many_{i}."""
     if value is None:
         return None
     if isinstance(value, int):
@@ -1478,6 +1641,18 @@ def coerce_{i}(value: Union[str, int, None]) -> Union[str, int, None]:
         return value
 
 
+def coerce_many_{i}(
+    values: list[Union[str, int, None]],
+) -> list[Union[str, int, None]]:
+    """Used in footer. All-str batches are parsed by one map(int, ...) sweep."""
+    if all(type(v) is str for v in values):
+        try:
+            return list(map(int, values))
+        except ValueError:
+            pass
+    return [coerce_{i}(v) for v in values]
+
+
 # ── Pattern: dead branch + unreachable ───────────────────────────────────────
 
 def validate_schema_{i}(ddl: str) -> bool:
@@ -1492,10 +1667,10 @@ def validate_schema_{i}(ddl: str) -> bool:
 
 def check_all_fields_{i}(model: type[Model_{i}]) -> list[str]:
     """Used below."""
-    issues = []
-    for name, fld in model._fields_{i}.items():
-        if fld.type not in FieldType_{i}:
-            issues.append(name)
+    issues = [
+        name for name, fld in model._fields_{i}.items()
+        if fld.type not in _VALID_FIELD_TYPES_{i}
+    ]
     return issues
     dead_return = issues   # RP005 — unreachable
 
@@ -1505,7 +1680,7 @@ def check_all_fields_{i}(model: type[Model_{i}]) -> list[str]:
 _pool_{i}   = ConnectionPool_{i}(":memory:")
 _sess_{i}   = Session_{i}(_pool_{i})
 _sess_{i}.init_schema(User_{i}, Post_{i})
-_coerced_{i} = coerce_{i}(str({i}))
+_coerced_{i} = coerce_many_{i}([str({i})])[0]
 _ddl_ok_{i}  = validate_schema_{i}(User_{i}.create_table_sql())
 _issues_{i}  = check_all_fields_{i}(User_{i})
 _chained_{i} = list(itertools.chain(
@@ -1517,6 +1692,7 @@ _pool_{i}.close_all()
 '''
 
 
+@lru_cache(maxsize=None)
 def _large_http_server(i: int) -> str:
     """Simulates a lightweight HTTP routing/middleware framework."""
     return f'''\
@@ -1528,8 +1704,8 @@ import functools
 import hashlib
 import hmac
 import http.cookies
-import json
 import logging
+import operator
 import re
 import time
 import traceback
@@ -1537,11 +1713,29 @@ import urllib.parse
 from collections import defaultdict
 from dataclasses import dataclass, field
 from enum import IntEnum, auto
-from typing import Any, Callable, ClassVar, Iterator, Optional
+from typing import Any, Callable, ClassVar, Optional
 
 log = logging.getLogger(__name__)
 _SECRET_KEY_{i} = hashlib.sha256(b"bench_{i}").hexdigest()
 
+# orjson emits UTF-8 bytes directly; the stdlib fallback encodes after dumps.
+try:
+    import orjson
+
+    def _json_dumps_{i}(obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+    def _json_loads_{i}(raw: bytes) -> Any:
+        return orjson.loads(raw)
+except ImportError:
+    import json
+
+    def _json_dumps_{i}(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
+    def _json_loads_{i}(raw: bytes) -> Any:
+        return json.loads(raw)
+
 
 # ── HTTP primitives ───────────────────────────────────────────────────────────
 
@@ -1557,25 +1751,49 @@ class Method_{i}(IntEnum):
 
 @dataclass
 class Headers_{i}:
-    _data: dict[str, list[str]] = field(default_factory=dict)
+    # Lower-cased name -> value; a list only once a name has been add()ed
+    # twice. Callers pass lower-case literals, so islower() skips .lower().
+    _data: dict[str, str | list[str]] = field(default_factory=dict)
+    # Set once any value has been promoted to a list; items() can then no
+    # longer hand back the dict's pairs as-is.
+    _multi: bool = field(default=False, repr=False, compare=False)
 
     def set(self, name: str, value: str) -> None:
-        self._data[name.lower()] = [value]
+        self._data[name if name.islower() else name.lower()] = value
 
     def add(self, name: str, value: str) -> None:
-        self._data.setdefault(name.lower(), []).append(value)
+        key = name if name.islower() else name.lower()
+        cur = self._data.get(key)
+        if cur is None:
+            self._data[key] = value
+        elif type(cur) is str:
+            self._data[key] = [cur, value]
+            self._multi = True
+        else:
+            cur.append(value)
 
     def get(self, name: str, default: str = "") -> str:
-        vals = self._data.get(name.lower(), [])
-        return vals[0] if vals else default
+        val = self._data.get(name if name.islower() else name.lower())
+        if val is None:
+            return default
+        return val if type(val) is str else val[0]
 
     def get_all(self, name: str) -> list[str]:
-        return self._data.get(name.lower(), [])
-
-    def items(self) -> Iterator[tuple[str, str]]:
-        for k, vals in self._data.items():
-            for v in vals:
-                yield k, v
+        val = self._data.get(name if name.islower() else name.lower())
+        if val is None:
+            return []
+        return [val] if type(val) is str else list(val)
+
+    def items(self) -> list[tuple[str, str]]:
+        if not self._multi:
+            return list(self._data.items())
+        out: list[tuple[str, str]] = []
+        for k, val in self._data.items():
+            if type(val) is str:
+                out.append((k, val))
+            else:
+                out.extend((k, v) for v in val)
+        return out
 
 
 @dataclass
@@ -1588,14 +1806,23 @@ class Request_{i}:
 
     @functools.cached_property
     def query(self) -> dict[str, str]:
-        if "?" not in self.path:
+        qs = self.path.partition("?")[2]
+        if not qs:
             return {{}}
-        qs = self.path.split("?", 1)[1]
-        return dict(urllib.parse.parse_qsl(qs))
+        if "%" in qs or "+" in qs:
+            return dict(urllib.parse.parse_qsl(qs))
+        # Plain ASCII query: skip parse_qsl's per-pair unquoting.  Blank
+        # values are dropped to match parse_qsl's default.
+        out: dict[str, str] = {{}}
+        for kv in qs.split("&"):
+            k, sep, v = kv.partition("=")
+            if sep and v:
+                out[k] = v
+        return out
 
     @functools.cached_property
     def json(self) -> Any:
-        return json.loads(self.body) if self.body else None
+        return _json_loads_{i}(self.body) if self.body else None
 
     @property
     def content_type(self) -> str:
@@ -1616,7 +1843,7 @@ class Response_{i}:
     def json_response(cls, data: Any, status: int = 200) -> "Response_{i}":
         r = cls(status=status)
         r.headers.set("content-type", "application/json")
-        r.body = json.dumps(data).encode()
+        r.body = _json_dumps_{i}(data)
         return r
 
     @classmethod
@@ -1657,12 +1884,17 @@ class AuthMiddleware_{i}(Middleware_{i}):
     """Used in Router below."""
     def __init__(self, secret: str = _SECRET_KEY_{i}) -> None:
         self._secret = secret
+        # Keyed once: copy() reuses the padded inner/outer states per request.
+        self._mac = hmac.new(secret.encode(), digestmod=hashlib.sha256)
 
     def _verify(self, token: str) -> bool:
         try:
-            raw  = base64.b64decode(token.encode())
-            sig  = hmac.new(self._secret.encode(), raw[:32], hashlib.sha256).digest()
-            return hmac.compare_digest(sig, raw[32:])
+            # b64decode takes the str directly; the memoryview slices the
+            # payload and signature without copying either half.
+            raw  = memoryview(base64.b64decode(token))
+            mac  = self._mac.copy()
+            mac.update(raw[:32])
+            return hmac.compare_digest(mac.digest(), raw[32:])
         except Exception:
             return False
 
@@ -1695,30 +1927,48 @@ class UnusedRateLimitMiddleware_{i}(Middleware_{i}):
 class CORSMiddleware_{i}(Middleware_{i}):
     """Used in Router below."""
     def __init__(self, origins: list[str]) -> None:
-        self._origins = set(origins)
+        # The wildcard is fixed at construction; don't re-hash it per request.
+        self._accept_all = "*" in origins
+        self._origins    = frozenset(origins) - {{"*"}}
 
     def __call__(self, request: Request_{i}, next: Handler_{i}) -> Response_{i}:
         origin = request.headers.get("origin")
         response = next(request)
-        if origin in self._origins or "*" in self._origins:
+        if self._accept_all or origin in self._origins:
             response.headers.set("access-control-allow-origin", origin or "*")
         return response
 
 
 # ── Router ────────────────────────────────────────────────────────────────────
 
+_PARAM_SEG_{i} = re.compile(r"<(\w+)>")
+
+
 @dataclass
 class Route_{i}:
     method:  Method_{i}
-    pattern: re.Pattern
+    path:    str
     handler: Handler_{i}
     name:    str = ""
     params:  ClassVar[set[str]] = set()
+    param_names: tuple[str, ...] = ()
+    wrapped: Optional[Handler_{i}] = None   # handler behind the middleware chain
+
+
+class _RouteNode_{i}:
+    """One path segment of the routing trie."""
+    __slots__ = ("literal", "param", "routes")
+
+    def __init__(self) -> None:
+        self.literal: dict[str, _RouteNode_{i}] = {{}}
+        self.param: Optional[_RouteNode_{i}] = None
+        self.routes: dict[Method_{i}, Route_{i}] = {{}}
 
 
 class Router_{i}:
     """Used in footer."""
     def __init__(self) -> None:
+        self._root = _RouteNode_{i}()
         self._routes: list[Route_{i}] = []
         self._middleware: list[Middleware_{i}] = []
         self._error_handlers: dict[int, Handler_{i}] = {{}}
@@ -1726,13 +1976,26 @@ class Router_{i}:
 
     def use(self, mw: Middleware_{i}) -> None:
         self._middleware.append(mw)
+        # The chain changed; routes re-wrap lazily on their next dispatch.
+        for route in self._routes:
+            route.wrapped = None
 
     def route(self, method: Method_{i}, path: str, name: str = "") -> Callable:
-        pattern = re.compile(
-            "^" + re.sub(r"<(\w+)>", r"(?P<\1>[^/]+)", path) + "$"
-        )
+        node = self._root
+        names: list[str] = []
+        for seg in path.split("/"):
+            m = _PARAM_SEG_{i}.fullmatch(seg)
+            if m:
+                names.append(m.group(1))
+                if node.param is None:
+                    node.param = _RouteNode_{i}()
+                node = node.param
+            else:
+                node = node.literal.setdefault(seg, _RouteNode_{i}())
         def decorator(fn: Handler_{i}) -> Handler_{i}:
-            self._routes.append(Route_{i}(method, pattern, fn, name))
+            route = Route_{i}(method, path, fn, name, tuple(names))
+            self._routes.append(route)
+            node.routes.setdefault(method, route)
             return fn
         return decorator
 
@@ -1742,21 +2005,40 @@ class Router_{i}:
             return fn
         return decorator
 
+    def _match(
+        self, node: _RouteNode_{i}, segs: list[str], pos: int,
+        captured: list[str], method: Method_{i},
+    ) -> Optional[tuple[Route_{i}, list[str]]]:
+        if pos == len(segs):
+            route = node.routes.get(method)
+            return (route, captured) if route else None
+        seg = segs[pos]
+        child = node.literal.get(seg)
+        if child is not None:
+            found = self._match(child, segs, pos + 1, captured, method)
+            if found:
+                return found
+        if node.param is not None and seg:
+            return self._match(node.param, segs, pos + 1, captured + [seg], method)
+        return None
+
     def dispatch(self, request: Request_{i}) -> Response_{i}:
-        clean_path = request.path.split("?")[0]
-        for route in self._routes:
-            m = route.pattern.match(clean_path)
-            if m and route.method == request.method:
-                request.params = m.groupdict()
-                handler = self._wrap_middleware(route.handler)
-                try:
-                    return handler(request)
-                except Exception:
-                    log.error(traceback.format_exc())
-                    err_handler = self._error_handlers.get(500)
-                    if err_handler:
-                        return err_handler(request)
-                    return Response_{i}.json_response({{"error": "Internal Server Error"}}, 500)
+        clean_path = request.path.partition("?")[0]
+        found = self._match(self._root, clean_path.split("/"), 0, [], request.method)
+        if found:
+            route, captured = found
+            request.params = dict(zip(route.param_names, captured))
+            handler = route.wrapped
+            if handler is None:
+                handler = route.wrapped = self._wrap_middleware(route.handler)
+            try:
+                return handler(request)
+            except Exception:
+                log.error(traceback.format_exc())
+                err_handler = self._error_handlers.get(500)
+                if err_handler:
+                    return err_handler(request)
+                return Response_{i}.json_response({{"error": "Internal Server Error"}}, 500)
         err_handler = self._error_handlers.get(404)
         if err_handler:
             return err_handler(request)
@@ -1781,18 +2063,26 @@ def _parse_accept_{i}(header: str) -> list[tuple[str, float]]:
         part = part.strip()
         if not part:
             continue
-        if ";q=" in part:
-            mime, q = part.split(";q=", 1)
-            result.append((mime.strip(), float(q)))
-        else:
-            result.append((part, 1.0))
+        mime, sep, q = part.partition(";q=")
+        result.append((mime.strip(), float(q)) if sep else (part, 1.0))
     if False:
         result.sort(key=lambda x: x[1])   # RP006 — dead sort
-    return sorted(result, key=lambda x: -x[1])
+    result.sort(key=operator.itemgetter(1), reverse=True)
+    return result
+
+
+# Characters SimpleCookie emits unquoted; anything else takes the slow path.
+_COOKIE_SAFE_{i} = re.compile(r"[A-Za-z0-9!#$%&'*+.^_`|~:-]+")
+# Attribute names (path, expires, ...) that SimpleCookie refuses as a
+# cookie name; they must take the slow path so it can raise CookieError.
+_COOKIE_RESERVED_{i} = frozenset(http.cookies.Morsel._reserved)
 
 
 def _cookie_header_{i}(name: str, value: str, http_only: bool = True) -> str:
     """Used in view below."""
+    if (_COOKIE_SAFE_{i}.fullmatch(name) and _COOKIE_SAFE_{i}.fullmatch(value)
+            and name.lower() not in _COOKIE_RESERVED_{i}):
+        return f"{{name}}={{value}}; HttpOnly" if http_only else f"{{name}}={{value}}"
     c = http.cookies.SimpleCookie()
     c[name] = value
     if http_only:
@@ -1845,9 +2135,18 @@ print(_resp_{i}.status, _resp_{i}.body[:60])
 # Edge-case files — one tricky pattern each
 # ─────────────────────────────────────────────────────────────────────────────
 
+def _fast_dedent(src: str, indent: str = "        ") -> str:
+    """textwrap.dedent for the fixed indent every EDGE_CASES body uses.
+
+    Two C-level str passes instead of dedent's per-line regex work; the
+    rstrip drops the closing-quote line's indent just as dedent would.
+    """
+    return ("\n" + src).replace("\n" + indent, "\n")[1:].rstrip(" ")
+
+
 EDGE_CASES: dict[str, str] = {
 
-    "ec01_type_checking_guard.py": textwrap.dedent("""\
+    "ec01_type_checking_guard.py": _fast_dedent("""\
         \"\"\"TYPE_CHECKING imports must NOT be flagged as RP001.\"\"\"
         from __future__ import annotations
         from typing import TYPE_CHECKING
@@ -1863,7 +2162,7 @@ EDGE_CASES: dict[str, str] = {
         print(greet("world"))
     """),
 
-    "ec02_annotation_only_no_rp002.py": textwrap.dedent("""\
+    "ec02_annotation_only_no_rp002.py": _fast_dedent("""\
         \"\"\"Annotation-only declarations must NOT fire RP002.\"\"\"
 
         def func_with_pure_annotations():
@@ -1882,7 +2181,7 @@ EDGE_CASES: dict[str, str] = {
             return 0
     """),
 
-    "ec03_augassign_is_use.py": textwrap.dedent("""\
+    "ec03_augassign_is_use.py": _fast_dedent("""\
         \"\"\"Augmented assignment counts as both read and write — no RP002.\"\"\"
 
         def counters():
@@ -1906,7 +2205,7 @@ EDGE_CASES: dict[str, str] = {
             return msg
     """),
 
-    "ec04_walrus_contexts.py": textwrap.dedent("""\
+    "ec04_walrus_contexts.py": _fast_dedent("""\
         \"\"\"Walrus operator (:=) in various contexts.\"\"\"
         import re
 
@@ -1935,7 +2234,7 @@ EDGE_CASES: dict[str, str] = {
             return 0
     """),
 
-    "ec05_underscore_exempt.py": textwrap.dedent("""\
+    "ec05_underscore_exempt.py": _fast_dedent("""\
         \"\"\"Names starting with _ are exempt from RP002/RP009.\"\"\"
 
         def discard_loop():
@@ -1957,7 +2256,7 @@ EDGE_CASES: dict[str, str] = {
             return 42
     """),
 
-    "ec06_locals_vars_suppress.py": textwrap.dedent("""\
+    "ec06_locals_vars_suppress.py": _fast_dedent("""\
         \"\"\"locals()/vars() suppress RP002 for the whole function.\"\"\"
 
         def uses_locals():
@@ -1976,7 +2275,7 @@ EDGE_CASES: dict[str, str] = {
             return 0
     """),
 
-    "ec07_dunder_all_protection.py": textwrap.dedent("""\
+    "ec07_dunder_all_protection.py": _fast_dedent("""\
         \"\"\"__all__ protects imports and functions from RP001/RP003.\"\"\"
         import re
         import sys              # NOT in __all__ and not used → RP001
@@ -1997,7 +2296,7 @@ EDGE_CASES: dict[str, str] = {
         __all__ = ["public_fn", "also_public", "re", "os"]
     """),
 
-    "ec08_star_import_no_flag.py": textwrap.dedent("""\
+    "ec08_star_import_no_flag.py": _fast_dedent("""\
         \"\"\"Star imports must NOT be flagged.\"\"\"
         from os.path import *     # no RP001 for star
         from typing import *      # no RP001 for star
@@ -2006,7 +2305,7 @@ EDGE_CASES: dict[str, str] = {
         x: Optional[int] = None            # Optional from typing.*
     """),
 
-    "ec09_unused_import_aliased.py": textwrap.dedent("""\
+    "ec09_unused_import_aliased.py": _fast_dedent("""\
         \"\"\"Aliased imports — alias is the local name to check.\"\"\"
         import numpy as np          # RP001: np unused
         import os as operating_sys  # RP001: operating_sys unused
@@ -2019,7 +2318,7 @@ EDGE_CASES: dict[str, str] = {
         print(p)
     """),
 
-    "ec10_import_redefined_by_assign.py": textwrap.dedent("""\
+    "ec10_import_redefined_by_assign.py": _fast_dedent("""\
         \"\"\"RP007: import clobbered by assignment before any read.\"\"\"
         import os           # RP007 — clobbered before read
         import sys          # NOT RP007 — read before reassignment
@@ -2033,7 +2332,7 @@ EDGE_CASES: dict[str, str] = {
         print(re, os, sys)
     """),
 
-    "ec11_if_false_none_dead_branch.py": textwrap.dedent("""\
+    "ec11_if_false_none_dead_branch.py": _fast_dedent("""\
         \"\"\"RP006: if False / if None / if 0 are dead branches.\"\"\"
 
         def check_false():
@@ -2063,7 +2362,7 @@ EDGE_CASES: dict[str, str] = {
             return 6
     """),
 
-    "ec12_unreachable_patterns.py": textwrap.dedent("""\
+    "ec12_unreachable_patterns.py": _fast_dedent("""\
         \"\"\"RP005: code after return/raise/continue/break.\"\"\"
 
         def after_return():
@@ -2094,7 +2393,7 @@ EDGE_CASES: dict[str, str] = {
                 print(i)         # NOT unreachable — only some iterations skip
     """),
 
-    "ec13_unused_args_patterns.py": textwrap.dedent("""\
+    "ec13_unused_args_patterns.py": _fast_dedent("""\
         \"\"\"RP008: unused function arguments, with many exemption patterns.\"\"\"
         from abc import ABC, abstractmethod
 
@@ -2128,7 +2427,7 @@ EDGE_CASES: dict[str, str] = {
                 pass
     """),
 
-    "ec14_unused_loop_vars.py": textwrap.dedent("""\
+    "ec14_unused_loop_vars.py": _fast_dedent("""\
         \"\"\"RP009: unused loop-control variables.\"\"\"
 
         def count_only():
@@ -2158,7 +2457,7 @@ EDGE_CASES: dict[str, str] = {
                 print(item)
     """),
 
-    "ec15_cross_file_anchor.py": textwrap.dedent("""\
+    "ec15_cross_file_anchor.py": _fast_dedent("""\
         \"\"\"Exported symbols used by ec16_cross_file_user.py.\"\"\"
 
         def exported_function():
@@ -2180,7 +2479,7 @@ EDGE_CASES: dict[str, str] = {
         EXPORTED_CONST = "hello"
     """),
 
-    "ec16_cross_file_user.py": textwrap.dedent("""\
+    "ec16_cross_file_user.py": _fast_dedent("""\
         \"\"\"Uses symbols from ec15_cross_file_anchor.py.\"\"\"
         from .ec15_cross_file_anchor import exported_function, ExportedClass
 
@@ -2189,7 +2488,7 @@ EDGE_CASES: dict[str, str] = {
         print(result, obj)
     """),
 
-    "ec17_false_positive_traps.py": textwrap.dedent("""\
+    "ec17_false_positive_traps.py": _fast_dedent("""\
         \"\"\"Patterns that must NEVER produce diagnostics.\"\"\"
         import os
         import sys
@@ -2238,7 +2537,7 @@ EDGE_CASES: dict[str, str] = {
             return result
     """),
 
-    "ec18_closure_capture.py": textwrap.dedent("""\
+    "ec18_closure_capture.py": _fast_dedent("""\
         \"\"\"Closure captures of outer variables must not trigger RP002.\"\"\"
 
         def outer_used_in_closure():
@@ -2264,7 +2563,7 @@ EDGE_CASES: dict[str, str] = {
             return inner
     """),
 
-    "ec19_abstract_method_exempt.py": textwrap.dedent("""\
+    "ec19_abstract_method_exempt.py": _fast_dedent("""\
         \"\"\"Abstract methods and protocol stubs must NOT fire RP008.\"\"\"
         from abc import ABC, abstractmethod
         from typing import Protocol
@@ -2290,7 +2589,7 @@ EDGE_CASES: dict[str, str] = {
                 return bool(value)  # strict unused — RP008
     """),
 
-    "ec20_conditional_import_fallback.py": textwrap.dedent("""\
+    "ec20_conditional_import_fallback.py": _fast_dedent("""\
         \"\"\"try/except import fallbacks bind the same name — no double-flag.\"\"\"
         try:
             import ujson as json
@@ -2313,7 +2612,7 @@ EDGE_CASES: dict[str, str] = {
         print(data, fib(10))
     """),
 
-    "ec21_property_getter_setter.py": textwrap.dedent("""\
+    "ec21_property_getter_setter.py": _fast_dedent("""\
         \"\"\"@property getter/setter/deleter — no false RP008 on self.\"\"\"
 
         class Temperature:
@@ -2348,7 +2647,7 @@ EDGE_CASES: dict[str, str] = {
         del t.celsius
     """),
 
-    "ec22_slots_class.py": textwrap.dedent("""\
+    "ec22_slots_class.py": _fast_dedent("""\
         \"\"\"__slots__ classes — no RP002 for slot declarations.\"\"\"
 
         class Point:
@@ -2375,7 +2674,7 @@ EDGE_CASES: dict[str, str] = {
         print(p, p.length())
     """),
 
-    "ec23_lambda_patterns.py": textwrap.dedent("""\
+    "ec23_lambda_patterns.py": _fast_dedent("""\
         \"\"\"Lambda expressions — variables holding lambdas should follow same rules.\"\"\"
         from functools import reduce
         import operator
@@ -2399,7 +2698,7 @@ EDGE_CASES: dict[str, str] = {
         print(result, ops)
     """),
 
-    "ec24_overload_pattern.py": textwrap.dedent("""\
+    "ec24_overload_pattern.py": _fast_dedent("""\
         \"\"\"@overload stubs — stub bodies do not count as 'used'.\"\"\"
         from typing import Union, overload
 
@@ -2423,7 +2722,7 @@ EDGE_CASES: dict[str, str] = {
         print(parse("42"), parse(99), parse(None))
     """),
 
-    "ec25_exception_chaining.py": textwrap.dedent("""\
+    "ec25_exception_chaining.py": _fast_dedent("""\
         \"\"\"Exception variable scoping — `as e` is cleared after except block.\"\"\"
 
         def parse_int(s: str) -> int:
@@ -2450,7 +2749,7 @@ EDGE_CASES: dict[str, str] = {
         print(multi_except(["1", "x", "3"]))
     """),
 
-    "ec26_star_unpack.py": textwrap.dedent("""\
+    "ec26_star_unpack.py": _fast_dedent("""\
         \"\"\"Star unpacking targets — starred name is a real assignment.\"\"\"
 
         def first_rest():
@@ -2472,7 +2771,7 @@ EDGE_CASES: dict[str, str] = {
         print(first_rest(), head_tail_unused_middle(), all_used())
     """),
 
-    "ec27_global_nonlocal.py": textwrap.dedent("""\
+    "ec27_global_nonlocal.py": _fast_dedent("""\
         \"\"\"global/nonlocal — mutations must not trigger RP002.\"\"\"
 
         _STATE = 0
@@ -2501,7 +2800,7 @@ EDGE_CASES: dict[str, str] = {
         print(counter(1), counter(2), read_state())
     """),
 
-    "ec28_functools_wraps.py": textwrap.dedent("""\
+    "ec28_functools_wraps.py": _fast_dedent("""\
         \"\"\"@functools.wraps decorated functions — decorator must not exempt RP003.\"\"\"
         import functools
         import time
@@ -2541,7 +2840,7 @@ EDGE_CASES: dict[str, str] = {
         print(fetch("http://example.com"))
     """),
 
-    "ec29_namedtuple_typed.py": textwrap.dedent("""\
+    "ec29_namedtuple_typed.py": _fast_dedent("""\
         \"\"\"typing.NamedTuple — fields are declarations, not RP002 targets.\"\"\"
         from typing import NamedTuple, Optional
 
@@ -2566,7 +2865,7 @@ EDGE_CASES: dict[str, str] = {
         print(p, cfg)
     """),
 
-    "ec30_if_name_main.py": textwrap.dedent("""\
+    "ec30_if_name_main.py": _fast_dedent("""\
         \"\"\"if __name__ == '__main__' guard — code inside is NOT dead.\"\"\"
         import sys
         import argparse
@@ -2594,15 +2893,113 @@ EDGE_CASES: dict[str, str] = {
 # Writer
 # ─────────────────────────────────────────────────────────────────────────────
 
-def write_file(path: str, content: str) -> None:
-    os.makedirs(os.path.dirname(path), exist_ok=True)
-    with open(path, "w", encoding="utf-8") as f:
-        f.write(content)
-    lines = content.count("\n")
-    print(f"  wrote {os.path.relpath(path, ROOT)}  ({lines} lines)")
+def _write(path: str, content: str) -> tuple[int, str]:
+    """Write content as UTF-8; return its line count and sha256."""
+    import hashlib
 
+    # Callers create the tier directories up front (see _make_dirs).
+    # Encode once and hand the bytes straight to os.write: no buffered or
+    # text-layer file object is built per file.
+    data = content.encode("utf-8")
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+    os.utime(path, (STABLE_MTIME, STABLE_MTIME))
+    return data.count(b"\n"), hashlib.sha256(data).hexdigest()
+
+
+def _relpath(path: str, start: str = ROOT) -> str:
+    """os.path.relpath for our own paths, which are built as start + os.sep
+    + name: a prefix slice, no getcwd/abspath. Anything else falls back."""
+    prefix = start + os.sep
+    if path.startswith(prefix):
+        return path[len(prefix):]
+    return os.path.relpath(path, start)
+
+
+def _make_dirs() -> None:
+    """Create every corpus directory once, before any file is written."""
+    for d in (SMALL_DIR, MEDIUM_DIR, LARGE_DIR, EDGE_DIR):
+        os.makedirs(d, exist_ok=True)
+
+
+def _add_to_tar(tar: tarfile.TarFile, path: str, content: str) -> tuple[int, str]:
+    import hashlib
+    import io
+    import tarfile
+
+    data = content.encode("utf-8")
+    info = tarfile.TarInfo(_relpath(path))
+    info.size = len(data)
+    info.mtime = STABLE_MTIME
+    tar.addfile(info, io.BytesIO(data))
+    return data.count(b"\n"), hashlib.sha256(data).hexdigest()
+
+
+def _manifest_key(path: str) -> str:
+    return _relpath(path, CORPUS_DIR).replace(os.sep, "/")
+
+
+def _report_line(path: str, lines: int) -> str:
+    return f"  wrote {_relpath(path)}  ({lines} lines)"
+
+
+def _render(item: tuple[Callable[[int], str], int, str]) -> str:
+    """Worker: build one module."""
+    gen, i, _ = item
+    return gen(i)
+
+
+def _render_and_write(item: tuple[Callable[[int], str], int, str]) -> tuple[int, str]:
+    """Worker: build one module and write it, returning _write's result."""
+    gen, i, path = item
+    return _write(path, gen(i))
+
+
+def write_generated(items: list[tuple[Callable[[int], str], int, str]],
+                    ex: ProcessPoolExecutor,
+                    manifest: dict[str, str],
+                    tar: Optional[tarfile.TarFile] = None) -> int:
+    """Render items across the pool and write them to disk (or into tar);
+    report in submission order, record digests in manifest and return the
+    total line count."""
+    if tar is None:
+        results = ex.map(_render_and_write, items, chunksize=8)
+    else:
+        bodies = ex.map(_render, items, chunksize=8)
+        results = (_add_to_tar(tar, path, body)
+                   for (_, _, path), body in zip(items, bodies))
+    total = 0
+    log = []
+    for (_, _, path), (lines, digest) in zip(items, results):
+        log.append(_report_line(path, lines))
+        manifest[_manifest_key(path)] = digest
+        total += lines
+    # One write per tier rather than one per file when stdout is a pipe.
+    print("\n".join(log))
+    return total
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    import argparse
+    import json
+    import tarfile
+    from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+    from itertools import cycle, islice
+
+    parser = argparse.ArgumentParser(description="Generate the Python benchmark corpus.")
+    parser.add_argument("--archive", metavar="PATH",
+                        help="write the corpus as one tar file instead of loose files")
+    parser.add_argument("--jobs", "-j", type=int, metavar="N",
+                        help="worker processes for rendering (default: CPU count)")
+    args = parser.parse_args(argv)
+    if args.jobs is not None and args.jobs < 1:
+        parser.error("--jobs must be at least 1")
 
-def main() -> None:
     # Trim to a fast, representative subset:
     #   20 small  (~90 lines each)   → covers all 12 flavours at least once
     #    8 medium (~200 lines each)  → 4 cache-service + 4 pipeline
@@ -2611,39 +3008,78 @@ def main() -> None:
     SMALL_COUNT  = 20
     MEDIUM_COUNT = 8
     LARGE_COUNT  = 4
-    EDGE_NAMES   = list(EDGE_CASES.keys())[:15]
-
-    print(f"=== Generating small corpus ({SMALL_COUNT} files) ===")
-    for idx in range(SMALL_COUNT):
-        flavour = SMALL_FLAVOURS[idx % len(SMALL_FLAVOURS)]
-        write_file(os.path.join(SMALL_DIR, f"small_{idx:02d}.py"), flavour(idx))
-
-    print(f"\n=== Generating medium corpus ({MEDIUM_COUNT} files) ===")
-    medium_generators = [_medium_cache_service, _medium_pipeline]
-    for idx in range(MEDIUM_COUNT):
-        gen = medium_generators[idx % len(medium_generators)]
-        write_file(os.path.join(MEDIUM_DIR, f"medium_{idx:02d}.py"), gen(idx))
-
-    print(f"\n=== Generating large corpus ({LARGE_COUNT} files) ===")
-    large_generators = [_large_orm, _large_http_server]
-    for idx in range(LARGE_COUNT):
-        gen = large_generators[idx % len(large_generators)]
-        content = gen(idx)
-        write_file(os.path.join(LARGE_DIR, f"large_{idx:02d}.py"), content)
-
-    print(f"\n=== Generating edge-case files ({len(EDGE_NAMES)} of {len(EDGE_CASES)}) ===")
-    for name in EDGE_NAMES:
-        write_file(os.path.join(EDGE_DIR, name), EDGE_CASES[name])
-
-    # Summary
-    small_lines  = sum(open(os.path.join(SMALL_DIR,  f)).read().count("\n")
-                       for f in os.listdir(SMALL_DIR)  if f.endswith(".py"))
-    medium_lines = sum(open(os.path.join(MEDIUM_DIR, f)).read().count("\n")
-                       for f in os.listdir(MEDIUM_DIR) if f.endswith(".py"))
-    large_lines  = sum(open(os.path.join(LARGE_DIR,  f)).read().count("\n")
-                       for f in os.listdir(LARGE_DIR)  if f.endswith(".py"))
-    edge_lines   = sum(open(os.path.join(EDGE_DIR,   f)).read().count("\n")
-                       for f in os.listdir(EDGE_DIR)   if f.endswith(".py"))
+    EDGE_NAMES   = tuple(islice(EDGE_CASES, 15))
+
+    medium_generators = (_medium_cache_service, _medium_pipeline)
+    large_generators = (_large_orm, _large_http_server)
+    # Destination paths are built once with a plain separator join; every
+    # directory is fixed, so os.path.join's normalisation buys nothing.
+    # Generators are assigned round-robin by cycling, not idx % len(...).
+    small_items = [
+        (gen, idx, f"{SMALL_DIR}{os.sep}small_{idx:02d}.py")
+        for idx, gen in zip(range(SMALL_COUNT), cycle(SMALL_FLAVOURS))
+    ]
+    medium_items = [
+        (gen, idx, f"{MEDIUM_DIR}{os.sep}medium_{idx:02d}.py")
+        for idx, gen in zip(range(MEDIUM_COUNT), cycle(medium_generators))
+    ]
+    large_items = [
+        (gen, idx, f"{LARGE_DIR}{os.sep}large_{idx:02d}.py")
+        for idx, gen in zip(range(LARGE_COUNT), cycle(large_generators))
+    ]
+    edge_paths = [f"{EDGE_DIR}{os.sep}{name}" for name in EDGE_NAMES]
+    edge_bodies = [EDGE_CASES[name] for name in EDGE_NAMES]
+
+    # --archive streams every entry into one tar file (members keep their
+    # corpus/<tier>/ paths) instead of creating ~50 small files.
+    manifest: dict[str, str] = {}
+    # Member names are short, plain ASCII, so USTAR headers always suffice;
+    # this rules out PAX extended-header blocks.
+    tar = (tarfile.open(args.archive, "w", format=tarfile.USTAR_FORMAT)
+           if args.archive else None)
+    if tar is None:
+        _make_dirs()
+    try:
+        # Generated tiers are independent, so render them in parallel.
+        # Edge cases are fixed strings; the pool would only add overhead.
+        with ProcessPoolExecutor(max_workers=args.jobs) as ex:
+            print(f"=== Generating small corpus ({SMALL_COUNT} files) ===")
+            small_lines = write_generated(small_items, ex, manifest, tar)
+
+            print(f"\n=== Generating medium corpus ({MEDIUM_COUNT} files) ===")
+            medium_lines = write_generated(medium_items, ex, manifest, tar)
+
+            print(f"\n=== Generating large corpus ({LARGE_COUNT} files) ===")
+            large_lines = write_generated(large_items, ex, manifest, tar)
+
+        print(f"\n=== Generating edge-case files ({len(EDGE_NAMES)} of {len(EDGE_CASES)}) ===")
+        if tar is None:
+            # Edge-case bodies are already built, so only the writes are
+            # left; keep several in flight per core on threads.
+            workers = min(32, (os.cpu_count() or 1) * 4)
+            with ThreadPoolExecutor(max_workers=workers) as tx:
+                results = list(tx.map(_write, edge_paths, edge_bodies))
+        else:
+            results = [_add_to_tar(tar, path, body)
+                       for path, body in zip(edge_paths, edge_bodies)]
+        edge_lines = 0
+        log = []
+        for path, (lines, digest) in zip(edge_paths, results):
+            log.append(_report_line(path, lines))
+            manifest[_manifest_key(path)] = digest
+            edge_lines += lines
+        print("\n".join(log))
+
+        # Downstream harnesses compare this against a previous run to skip
+        # re-linting an unchanged corpus.
+        manifest_body = json.dumps(manifest, indent=2, sort_keys=True) + "\n"
+        if tar is None:
+            _write(MANIFEST_PATH, manifest_body)
+        else:
+            _add_to_tar(tar, MANIFEST_PATH, manifest_body)
+    finally:
+        if tar is not None:
+            tar.close()
 
     total_files = SMALL_COUNT + MEDIUM_COUNT + LARGE_COUNT + len(EDGE_NAMES)
     total_lines = small_lines + medium_lines + large_lines + edge_lines